@@ -1,10 +1,27 @@
 """Table Maker - Generate random tables as PNG images and JSON data."""
 
-from .table_data import TableData
-from .dimensions import TableDimensions, generate_table_dimensions
-from .generators import RandomDataGenerator
-from .visualizer import TableVisualizer
-from .maker import generate_table, generate_tables
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .table_data import TableData
+    from .dimensions import TableDimensions, generate_table_dimensions
+    from .generators import RandomDataGenerator
+    from .visualizer import TableVisualizer
+    from .maker import encode_table, generate_table, generate_tables
+
+# Exports are imported on first access so the CLI can parse arguments
+# without paying for the Faker and Pillow imports
+_EXPORT_MODULES = {
+    "TableData": ".table_data",
+    "TableDimensions": ".dimensions",
+    "RandomDataGenerator": ".generators",
+    "TableVisualizer": ".visualizer",
+    "generate_table_dimensions": ".dimensions",
+    "generate_table": ".maker",
+    "encode_table": ".maker",
+    "generate_tables": ".maker",
+}
 
 __all__ = [
     "TableData",
@@ -14,4 +31,12 @@ __all__ = [
     "generate_table_dimensions",
     "generate_table",
     "generate_tables",
+    "encode_table",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names lazily from their submodules."""
+    if name in _EXPORT_MODULES:
+        return getattr(import_module(_EXPORT_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
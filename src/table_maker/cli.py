@@ -1,10 +1,9 @@
 #!/usr/bin/env python3
 import argparse
+import os
 from pathlib import Path
 from typing import Optional
 
-from table_maker.maker import generate_tables
-
 
 def parse_args() -> argparse.Namespace:
     """Parse command-line arguments for table generation."""
@@ -105,6 +104,32 @@ def parse_args() -> argparse.Namespace:
         default="none",
         help="Include headers: 'none', 'column', 'row', or 'both' (default: none)",
     )
+    parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--png-compress-level",
+        type=int,
+        default=1,
+        choices=range(10),
+        metavar="{0-9}",
+        help="PNG zlib compression level, lower is faster (default: 1)",
+    )
+    parser.add_argument(
+        "--pretty-json",
+        action="store_true",
+        help="Indent the JSON files for readability (default: compact)",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Seed for reproducible output (default: random)",
+    )
 
     return parser.parse_args()
 
@@ -113,6 +138,9 @@ def main() -> None:
     """Generate table image and JSON data based on command-line arguments."""
     args = parse_args()
 
+    # Deferred so that --help and argument errors don't load Faker and Pillow
+    from table_maker.maker import generate_tables
+
     output_dir = Path(args.output) if args.output else None
 
     # Convert style argument to is_normal parameter
@@ -161,6 +189,10 @@ def main() -> None:
         column_header_probability=column_header_probability,
         row_header_probability=row_header_probability,
         wrap_mode=args.wrap_mode,
+        workers=args.workers,
+        seed=args.seed,
+        png_compress_level=args.png_compress_level,
+        pretty_json=args.pretty_json,
     )
 
     # Group results by directory for clearer output
@@ -1,5 +1,11 @@
 import random
-from typing import List, Tuple
+from itertools import accumulate
+from typing import List, Optional, Tuple
+
+
+# Line styles for non-uniform grids, with cumulative weights precomputed once
+LINE_STYLES = ["solid_black", "dotted_black", "solid_gray", "removed"]
+LINE_STYLE_CUM_WEIGHTS = list(accumulate([0.7, 0.1, 0.1, 0.1]))
 
 
 class TableDimensions:
@@ -12,7 +18,8 @@ class TableDimensions:
         total_width: int, 
         total_height: int,
         margin: int = 10,
-        is_uniform: bool = True
+        is_uniform: bool = True,
+        rng: Optional[random.Random] = None,
     ):
         """Initialize table dimensions.
         
@@ -23,6 +30,7 @@ class TableDimensions:
             total_height: Total height in pixels (excluding margins)
             margin: Margin size in pixels
             is_uniform: Whether cells should be uniform in size
+            rng: Random number generator to use, or None for a fresh one
         """
         self.rows = rows
         self.columns = columns
@@ -30,6 +38,7 @@ class TableDimensions:
         self.total_height = total_height
         self.margin = margin
         self.is_uniform = is_uniform
+        self.rng = rng if rng is not None else random.Random()
         
         # Generate cell sizes
         self.column_widths = self._generate_cell_sizes(
@@ -39,6 +48,10 @@ class TableDimensions:
             rows, total_height, min_size=30, uniform=is_uniform
         )
         
+        # Pixel positions of the grid lines, margin included
+        self.x_edges = [margin + x for x in [0, *accumulate(self.column_widths)]]
+        self.y_edges = [margin + y for y in [0, *accumulate(self.row_heights)]]
+        
         # Generate line styles
         self.horizontal_styles, self.vertical_styles = self._generate_line_styles()
     
@@ -47,15 +60,18 @@ class TableDimensions:
     ) -> List[int]:
         """Generate sizes for num_cells that sum to total_size, each at least min_size."""
         if uniform:
-            base_size = total_size // num_cells
-            remainder = total_size % num_cells
-            return [base_size + (1 if i < remainder else 0) for i in range(num_cells)]
+            base_size, remainder = divmod(total_size, num_cells)
+            return [base_size + 1] * remainder + [base_size] * (num_cells - remainder)
         else:
-            sizes = [min_size] * num_cells
-            remaining = total_size - min_size * num_cells
-            while remaining > 0:
-                sizes[random.randint(0, num_cells - 1)] += 1
-                remaining -= 1
+            # Each spare pixel lands in a uniformly random cell; draw that
+            # multinomial as one binomial per cell instead of pixel by pixel
+            sizes = []
+            remaining = max(0, total_size - min_size * num_cells)
+            for i in range(num_cells - 1):
+                extra = self.rng.binomialvariate(remaining, 1 / (num_cells - i))
+                sizes.append(min_size + extra)
+                remaining -= extra
+            sizes.append(min_size + remaining)
             return sizes
     
     def _generate_line_styles(self) -> Tuple[List[str], List[str]]:
@@ -64,14 +80,14 @@ class TableDimensions:
             hor_styles = ["solid_black"] * (self.rows + 1)
             ver_styles = ["solid_black"] * (self.columns + 1)
         else:
-            styles = ["solid_black", "dotted_black", "solid_gray", "removed"]
-            weights = [0.7, 0.1, 0.1, 0.1]
-            hor_styles = [
-                random.choices(styles, weights=weights)[0] for _ in range(self.rows + 1)
-            ]
-            ver_styles = [
-                random.choices(styles, weights=weights)[0] for _ in range(self.columns + 1)
-            ]
+            # Draw all line styles in one call, then split by orientation
+            styles = self.rng.choices(
+                LINE_STYLES,
+                cum_weights=LINE_STYLE_CUM_WEIGHTS,
+                k=self.rows + self.columns + 2,
+            )
+            hor_styles = styles[: self.rows + 1]
+            ver_styles = styles[self.rows + 1 :]
         return hor_styles, ver_styles
 
 
@@ -81,6 +97,7 @@ def generate_table_dimensions(
     min_columns: int = 1,
     max_rows: int = 15,
     max_columns: int = 40,
+    rng: Optional[random.Random] = None,
 ) -> Tuple[int, int, int, int]:
     """Generate random table dimensions within constraints, accounting for margins.
     
@@ -90,16 +107,19 @@ def generate_table_dimensions(
         min_columns: Minimum number of columns to generate
         max_rows: Maximum number of rows to generate
         max_columns: Maximum number of columns to generate
+        rng: Random number generator to use, or None for a fresh one
     
     Returns:
         Tuple of (rows, columns, total_width, total_height)
     """
-    rows = random.randint(min_rows, max(min_rows, max_rows))
-    columns = random.randint(min_columns, max(min_columns, max_columns))
+    if rng is None:
+        rng = random.Random()
+    rows = rng.randint(min_rows, max(min_rows, max_rows))
+    columns = rng.randint(min_columns, max(min_columns, max_columns))
     min_width = columns * 40
     min_height = rows * 30
     max_width = 2560 - 2 * margin
     max_height = 1600 - 2 * margin
-    total_width = random.randint(max(500, min_width), max_width)
-    total_height = random.randint(max(500, min_height), max_height)
+    total_width = rng.randint(max(500, min_width), max_width)
+    total_height = rng.randint(max(500, min_height), max_height)
     return rows, columns, total_width, total_height
\ No newline at end of file
@@ -1,21 +1,39 @@
 import random
+import string
 from faker import Faker
-from typing import Optional
+from typing import List, Optional, Sequence, Tuple
 from .table_data import TableData
 
 
+# Alphabet for short letter cells, drawn directly rather than through Faker
+LETTERS = string.ascii_letters
+
+
 class RandomDataGenerator:
     """Generator for random table data."""
     
-    def __init__(self, faker_seed: Optional[int] = None):
+    def __init__(
+        self, faker_seed: Optional[int] = None, rng: Optional[random.Random] = None
+    ):
         """Initialize the random data generator.
         
         Args:
-            faker_seed: Optional seed for the Faker instance
+            faker_seed: Optional seed for the Faker instance and random generator
+            rng: Random number generator to use, or None for a fresh one
         """
         self.fake = Faker()
+        self.rng = rng if rng is not None else random.Random()
         if faker_seed is not None:
-            self.fake.seed_instance(faker_seed)
+            self.seed(faker_seed)
+    
+    def seed(self, faker_seed: int) -> None:
+        """Reseed Faker and the random generator, e.g. before each table of a batch.
+        
+        Args:
+            faker_seed: Seed for the Faker instance and random generator
+        """
+        self.fake.seed_instance(faker_seed)
+        self.rng.seed(faker_seed)
     
     def generate_table_data(
         self,
@@ -45,9 +63,17 @@ class RandomDataGenerator:
         Returns:
             TableData object containing the generated content
         """
+        # Bind hot lookups to locals for the per-cell loops below
+        rng = self.rng
+        rand = rng.random
+        randint = rng.randint
+        randrange = rng.randrange
+        choice = rng.choice
+        fake = self.fake
+        
         # Determine if table has headers
-        has_column_headers = random.random() < column_header_probability
-        has_row_headers = random.random() < row_header_probability
+        has_column_headers = rand() < column_header_probability
+        has_row_headers = rand() < row_header_probability
         
         # Create the table data structure
         table = TableData(
@@ -56,6 +82,7 @@ class RandomDataGenerator:
             has_column_headers=has_column_headers,
             has_row_headers=has_row_headers,
         )
+        data = table.data
         
         # Determine empty rows and columns
         empty_rows = [False] * rows
@@ -64,81 +91,102 @@ class RandomDataGenerator:
         if not is_normal:
             # Each row has independent chance to be empty
             for i in range(rows):
-                if random.random() < empty_row_probability:
+                if rand() < empty_row_probability:
                     empty_rows[i] = True
             
             # Still using original logic for empty column
-            if random.random() < empty_column_probability:
-                empty_column = random.randint(0, columns - 1)
+            if rand() < empty_column_probability:
+                empty_column = randint(0, columns - 1)
         
         # Generate column headers if needed
         if has_column_headers:
+            # Pick a header style first so only the chosen one calls Faker
+            column_header_makers = (
+                lambda: fake.word().capitalize(),
+                lambda: " ".join(fake.words(nb=randint(1, 2))).title(),
+                fake.last_name,
+                fake.currency_name,
+            )
             for j in range(columns):
                 # Skip empty columns
                 if j == empty_column:
                     continue
                 
                 # Generate a header (always text)
-                header_options = [
-                    self.fake.word().capitalize(),
-                    " ".join(
-                        [word.capitalize() for word in self.fake.words(nb=random.randint(1, 2))]
-                    ),
-                    self.fake.last_name(),
-                    self.fake.currency_name(),
-                ]
-                table.column_headers[j] = random.choice(header_options)
+                table.column_headers[j] = choice(column_header_makers)()
         
         # Generate row headers if needed
         if has_row_headers:
+            row_header_makers = (
+                lambda: fake.word().capitalize(),
+                fake.last_name,
+                fake.first_name,
+                fake.country,
+            )
             for i in range(rows):
                 # Skip empty rows
                 if empty_rows[i]:
                     continue
                 
                 # Generate a header (always text or numbers)
-                if random.random() < 0.7:
+                if rand() < 0.7:
                     # Text header
-                    header_options = [
-                        self.fake.word().capitalize(),
-                        self.fake.last_name(),
-                        self.fake.first_name(),
-                        self.fake.country(),
-                    ]
-                    table.row_headers[i] = random.choice(header_options)
+                    table.row_headers[i] = choice(row_header_makers)()
                 else:
                     # Numeric header (like row numbers)
                     table.row_headers[i] = str(i)
         
-        # Generate main table data
+        # Word and letter cells are filled afterwards from one bulk Faker draw each,
+        # recorded here as (row, column, length)
+        word_cells: List[Tuple[int, int, int]] = []
+        letter_cells: List[Tuple[int, int, int]] = []
+        
+        # Generate main table data, never visiting empty rows or the empty column
+        filled_columns = [j for j in range(columns) if j != empty_column]
         for i in range(rows):
-            for j in range(columns):
-                # Skip if should be empty
-                if empty_rows[i] or j == empty_column:
-                    continue
-                
-                if random.random() < empty_cell_probability:
+            if empty_rows[i]:
+                continue
+            row = data[i]
+            for j in filled_columns:
+                if rand() < empty_cell_probability:
                     continue  # Leave as None
                 else:
-                    if random.random() < 0.6:
+                    if rand() < 0.6:
                         # Determine if we should generate a large number
-                        if random.random() < large_number_probability:
-                            # Generate large integers of varying lengths
-                            digit_count = random.choice([15, 20, 25, 30])
-                            text = "".join(
-                                [str(random.randint(0, 9)) for _ in range(digit_count)]
-                            )
-                        elif random.random() < 0.5:
-                            text = str(self.fake.random_int(min=0, max=999))
+                        if rand() < large_number_probability:
+                            # Generate large integers of varying lengths, zero-padded
+                            # so every digit is uniform like the per-digit draw
+                            digit_count = choice([15, 20, 25, 30])
+                            text = f"{randrange(10**digit_count):0{digit_count}d}"
+                        elif rand() < 0.5:
+                            text = str(randint(0, 999))
                         else:
-                            text = f"{self.fake.pyfloat(left_digits=2, right_digits=2, positive=True):.2f}"
+                            # Positive with two integer and two decimal digits
+                            text = f"{randint(1, 9999) / 100:.2f}"
                     else:
-                        if random.random() < 0.5:
-                            text = "".join(
-                                [self.fake.random_letter() for _ in range(random.randint(1, 3))]
-                            )
+                        if rand() < 0.5:
+                            letter_cells.append((i, j, randint(1, 3)))
                         else:
-                            text = " ".join(self.fake.words(nb=random.randint(1, 5)))
-                    table.data[i][j] = text
+                            word_cells.append((i, j, randint(1, 5)))
+                        continue
+                    row[j] = text
+        
+        letters = rng.choices(LETTERS, k=sum(k for _, _, k in letter_cells))
+        self._fill_from_pool(data, letter_cells, letters, "")
+        words = fake.words(nb=sum(k for _, _, k in word_cells))
+        self._fill_from_pool(data, word_cells, words, " ")
         
-        return table
\ No newline at end of file
+        return table
+    
+    @staticmethod
+    def _fill_from_pool(
+        data: List[List[Optional[str]]],
+        cells: List[Tuple[int, int, int]],
+        pool: Sequence[str],
+        separator: str,
+    ) -> None:
+        """Join consecutive slices of pool into each (row, column, length) cell."""
+        start = 0
+        for i, j, length in cells:
+            data[i][j] = separator.join(pool[start : start + length])
+            start += length
\ No newline at end of file
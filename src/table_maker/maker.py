@@ -1,12 +1,19 @@
+import io
 import random
 import json
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Tuple, Dict, Optional
+from typing import Any, List, Tuple, Dict, Optional
 
 from .dimensions import TableDimensions, generate_table_dimensions
 from .generators import RandomDataGenerator
 from .visualizer import TableVisualizer
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # Path configuration constants
 OUTPUT_DIRS = {"images": "images", "json": "json"}
@@ -31,6 +38,10 @@ def generate_table(
     row_header_probability: float = 0.0,
     wrap_mode: str = "word",
     output_paths: Optional[Dict[str, Path]] = None,
+    seed: Optional[int] = None,
+    png_compress_level: int = 1,
+    pretty_json: bool = False,
+    data_generator: Optional[RandomDataGenerator] = None,
 ) -> Tuple[Path, Path]:
     """Generate and save a table image and JSON data.
     
@@ -53,14 +64,122 @@ def generate_table(
         column_header_probability: Probability of generating column headers (0.0-1.0)
         row_header_probability: Probability of generating row headers (0.0-1.0)
         wrap_mode: Text wrapping mode: "word" (default), "none", or "char"
-        output_paths: Optional dict with explicit output paths for 'image' and 'json'
+        output_paths: Optional dict with explicit output paths for 'image' and 'json';
+                      their parent directories must already exist
+        seed: Optional seed for reproducible table generation
+        png_compress_level: zlib level for the PNG (0-9); lower is faster but larger
+        pretty_json: Indent the JSON file for reading instead of writing it compactly
+        data_generator: Optional generator to reuse across calls instead of
+                        constructing a new Faker instance per table
     
     Returns:
         Tuple of paths to the generated image and JSON files.
     """
+    png_bytes, json_bytes = encode_table(
+        min_rows=min_rows,
+        min_columns=min_columns,
+        max_rows=max_rows,
+        max_columns=max_columns,
+        is_normal=is_normal,
+        normal_probability=normal_probability,
+        margin=margin,
+        empty_row_probability=empty_row_probability,
+        empty_column_probability=empty_column_probability,
+        empty_cell_probability=empty_cell_probability,
+        large_number_probability=large_number_probability,
+        column_header_probability=column_header_probability,
+        row_header_probability=row_header_probability,
+        wrap_mode=wrap_mode,
+        seed=seed,
+        png_compress_level=png_compress_level,
+        pretty_json=pretty_json,
+        data_generator=data_generator,
+    )
+    
+    # Determine output paths
+    if output_paths:
+        # Use explicitly provided paths
+        image_path = output_paths["image"]
+        json_path = output_paths["json"]
+    else:
+        # Use output_dir with filename
+        if output_dir is None:
+            output_dir = Path.cwd()
+        else:
+            output_dir = Path(output_dir)
+        
+        # Ensure directories exist
+        output_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Create file paths
+        image_path = output_dir / f"{output_filename}{FILE_EXTENSIONS['image']}"
+        json_path = output_dir / f"{output_filename}{FILE_EXTENSIONS['json']}"
+    
+    # Save the image and the table data as JSON
+    image_path.write_bytes(png_bytes)
+    json_path.write_bytes(json_bytes)
+    
+    return image_path, json_path
+
+
+def encode_table(
+    min_rows: int = 1,
+    min_columns: int = 1,
+    max_rows: int = 15,
+    max_columns: int = 40,
+    is_normal: Optional[bool] = None,
+    normal_probability: float = 0.5,
+    margin: int = 10,
+    empty_row_probability: float = 0.3,
+    empty_column_probability: float = 0.3,
+    empty_cell_probability: float = 0.2,
+    large_number_probability: float = 0.05,
+    column_header_probability: float = 0.0,
+    row_header_probability: float = 0.0,
+    wrap_mode: str = "word",
+    seed: Optional[int] = None,
+    png_compress_level: int = 1,
+    pretty_json: bool = False,
+    data_generator: Optional[RandomDataGenerator] = None,
+) -> Tuple[bytes, bytes]:
+    """Generate a table and return its PNG and JSON bytes without writing files.
+    
+    Args:
+        min_rows: Minimum number of rows to generate
+        min_columns: Minimum number of columns to generate
+        max_rows: Maximum number of rows to generate
+        max_columns: Maximum number of columns to generate
+        is_normal: Regular or varied table as in generate_table, or None to decide
+                   randomly based on normal_probability
+        normal_probability: Probability of a normal table when is_normal is None
+        margin: Margin size in pixels around the table
+        empty_row_probability: Probability of each row being empty (when not normal)
+        empty_column_probability: Probability of an empty column (when not normal)
+        empty_cell_probability: Probability of any individual cell being empty
+        large_number_probability: Probability of very large numbers (15-30 digits)
+        column_header_probability: Probability of generating column headers (0.0-1.0)
+        row_header_probability: Probability of generating row headers (0.0-1.0)
+        wrap_mode: Text wrapping mode: "word" (default), "none", or "char"
+        seed: Optional seed for reproducible table generation
+        png_compress_level: zlib level for the PNG (0-9); lower is faster but larger
+        pretty_json: Indent the JSON for reading instead of encoding it compactly
+        data_generator: Optional generator to reuse across calls instead of
+                        constructing a new Faker instance per table
+    
+    Returns:
+        Tuple of the encoded PNG image and JSON data.
+    """
+    # Every random choice for this table comes from the generator's RNG,
+    # so a single seed reproduces the whole table
+    if data_generator is None:
+        data_generator = RandomDataGenerator(faker_seed=seed)
+    elif seed is not None:
+        data_generator.seed(seed)
+    rng = data_generator.rng
+    
     # Determine if this table is normal
     if is_normal is None:
-        is_normal = random.random() < normal_probability
+        is_normal = rng.random() < normal_probability
     
     # Generate table dimensions
     rows, columns, total_width, total_height = generate_table_dimensions(
@@ -69,6 +188,7 @@ def generate_table(
         min_columns=min_columns,
         max_rows=max_rows,
         max_columns=max_columns,
+        rng=rng,
     )
     
     # Create the dimensions object
@@ -78,11 +198,11 @@ def generate_table(
         total_width=total_width,
         total_height=total_height,
         margin=margin,
-        is_uniform=is_normal
+        is_uniform=is_normal,
+        rng=rng,
     )
     
     # Generate the data
-    data_generator = RandomDataGenerator()
     table_data = data_generator.generate_table_data(
         rows=rows,
         columns=columns,
@@ -96,40 +216,22 @@ def generate_table(
     )
     
     # Render the table
-    visualizer = TableVisualizer(wrap_mode=wrap_mode)
+    visualizer = TableVisualizer(wrap_mode=wrap_mode, rng=rng)
     image = visualizer.render(table_data, dimensions)
     
-    # Determine output paths
-    if output_paths:
-        # Use explicitly provided paths
-        image_path = output_paths["image"]
-        json_path = output_paths["json"]
-    else:
-        # Use output_dir with filename
-        if output_dir is None:
-            output_dir = Path.cwd()
-        else:
-            output_dir = Path(output_dir)
-        
-        # Ensure directories exist
-        output_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Create file paths
-        image_path = output_dir / f"{output_filename}{FILE_EXTENSIONS['image']}"
-        json_path = output_dir / f"{output_filename}{FILE_EXTENSIONS['json']}"
-    
-    # Ensure parent directories exist
-    image_path.parent.mkdir(parents=True, exist_ok=True)
-    json_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    # Save the image
-    image.save(image_path)
-    
-    # Save the table data as JSON
-    with open(json_path, "w") as f:
-        json.dump(table_data.to_dict(), f, indent=2)
-    
-    return image_path, json_path
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG", compress_level=png_compress_level, optimize=False)
+    return buffer.getvalue(), _dump_json(table_data.to_dict(), pretty=pretty_json)
+
+
+def _dump_json(data: Dict[str, Any], pretty: bool = False) -> bytes:
+    """Encode data as compact or indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else None
+        return orjson.dumps(data, option=option)
+    if pretty:
+        return json.dumps(data, indent=2).encode()
+    return json.dumps(data, separators=(",", ":")).encode()
 
 
 def generate_tables(
@@ -149,6 +251,10 @@ def generate_tables(
     column_header_probability: float = 0.0,
     row_header_probability: float = 0.0,
     wrap_mode: str = "word",
+    workers: int = 1,
+    seed: Optional[int] = None,
+    png_compress_level: int = 1,
+    pretty_json: bool = False,
 ) -> List[Tuple[Path, Path]]:
     """Generate multiple tables with configurable parameters.
     
@@ -171,6 +277,10 @@ def generate_tables(
         column_header_probability: Probability of generating column headers (0.0-1.0)
         row_header_probability: Probability of generating row headers (0.0-1.0)
         wrap_mode: Text wrapping mode: "word" (default), "none", or "char"
+        workers: Number of worker processes used to generate tables in parallel
+        seed: Optional seed for reproducible output, independent of workers
+        png_compress_level: zlib level for the PNGs (0-9); lower is faster but larger
+        pretty_json: Indent the JSON files for reading instead of writing them compactly
     
     Returns:
         List of tuples containing paths to the generated image and JSON files
@@ -188,7 +298,10 @@ def generate_tables(
     images_dir.mkdir(parents=True, exist_ok=True)
     json_dir.mkdir(parents=True, exist_ok=True)
     
-    results = []
+    # Draw one seed per table up front so output does not depend on workers
+    seeder = random.Random(seed)
+    
+    tasks: List[Dict[str, Any]] = []
     for i in range(count):
         # Generate a unique filename for this table
         filename = f"table_{i + 1}" if count > 1 else "table"
@@ -199,26 +312,52 @@ def generate_tables(
             "json": json_dir / f"{filename}{FILE_EXTENSIONS['json']}",
         }
         
-        # Generate the table with explicit output paths
-        image_path, json_path = generate_table(
-            min_rows=min_rows,
-            min_columns=min_columns,
-            max_rows=max_rows,
-            max_columns=max_columns,
-            output_filename=filename,
-            is_normal=is_normal,
-            normal_probability=normal_probability,
-            margin=margin,
-            empty_row_probability=empty_row_probability,
-            empty_column_probability=empty_column_probability,
-            empty_cell_probability=empty_cell_probability,
-            large_number_probability=large_number_probability,
-            column_header_probability=column_header_probability,
-            row_header_probability=row_header_probability,
-            wrap_mode=wrap_mode,
-            output_paths=output_paths,
+        tasks.append(
+            dict(
+                min_rows=min_rows,
+                min_columns=min_columns,
+                max_rows=max_rows,
+                max_columns=max_columns,
+                output_filename=filename,
+                is_normal=is_normal,
+                normal_probability=normal_probability,
+                margin=margin,
+                empty_row_probability=empty_row_probability,
+                empty_column_probability=empty_column_probability,
+                empty_cell_probability=empty_cell_probability,
+                large_number_probability=large_number_probability,
+                column_header_probability=column_header_probability,
+                row_header_probability=row_header_probability,
+                wrap_mode=wrap_mode,
+                output_paths=output_paths,
+                seed=seeder.getrandbits(32),
+                png_compress_level=png_compress_level,
+                pretty_json=pretty_json,
+            )
         )
-        
-        results.append((image_path, json_path))
     
-    return results
\ No newline at end of file
+    # Pool startup isn't worth it for a single table or worker
+    if count <= 1 or workers <= 1:
+        data_generator = RandomDataGenerator()
+        return [generate_table(**task, data_generator=data_generator) for task in tasks]
+    
+    chunksize = max(1, count // (4 * workers))
+    with ProcessPoolExecutor(
+        max_workers=min(workers, count), initializer=_init_worker
+    ) as executor:
+        return list(executor.map(_generate_one, tasks, chunksize=chunksize))
+
+
+# Per-process data generator, created once by the pool initializer
+_worker_generator: Optional[RandomDataGenerator] = None
+
+
+def _init_worker() -> None:
+    """Create the data generator reused by every table in this worker."""
+    global _worker_generator
+    _worker_generator = RandomDataGenerator()
+
+
+def _generate_one(task: Dict[str, Any]) -> Tuple[Path, Path]:
+    """Generate a single table from a picklable dict of keyword arguments."""
+    return generate_table(**task, data_generator=_worker_generator)
@@ -25,7 +25,7 @@ class TableData:
         self.has_row_headers = has_row_headers
         
         # Initialize data structures
-        self.data: List[List[Optional[str]]] = [[None for _ in range(columns)] for _ in range(rows)]
+        self.data: List[List[Optional[str]]] = [[None] * columns for _ in range(rows)]
         self.column_headers: List[Optional[str]] = [None] * columns if has_column_headers else []
         self.row_headers: List[Optional[str]] = [None] * rows if has_row_headers else []
         self.corner_header: Optional[str] = "ID" if has_column_headers and has_row_headers else None
@@ -1,21 +1,57 @@
 from PIL import Image, ImageDraw, ImageFont
 import random
+from bisect import bisect_right
+from functools import lru_cache
 from itertools import accumulate
-from typing import List, Optional, Union, Any
+from typing import List, Optional, Tuple, Any
 from .table_data import TableData
 from .dimensions import TableDimensions
 
 
+@lru_cache(maxsize=None)
+def _load_fonts(
+    font_size: int,
+) -> Tuple[ImageFont.FreeTypeFont, ImageFont.FreeTypeFont]:
+    """Load the regular and header fonts for a size, once per process."""
+    # Try to load the regular font
+    try:
+        font = ImageFont.truetype("Helvetica.ttf", font_size)
+    except IOError:
+        font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", font_size)
+    
+    # Try to get a bold font for headers
+    try:
+        header_font = ImageFont.truetype("Helvetica-Bold.ttf", font_size)
+    except IOError:
+        try:
+            header_font = ImageFont.truetype(
+                "/System/Library/Fonts/Helvetica.ttc", font_size, index=1
+            )
+        except IOError:
+            # Fall back to regular font if bold isn't available
+            header_font = font
+    
+    return font, header_font
+
+
+@lru_cache(maxsize=100_000)
+def _text_length(font: ImageFont.FreeTypeFont, text: str) -> float:
+    """Measure text with a font, memoized as the same words recur across cells."""
+    return font.getlength(text)
+
+
 class TableVisualizer:
     """Class for rendering table data as images."""
     
-    def __init__(self, wrap_mode: str = "word"):
+    def __init__(self, wrap_mode: str = "word", rng: Optional[random.Random] = None):
         """Initialize the table visualizer.
         
         Args:
             wrap_mode: Text wrapping mode ("word", "none", or "char")
+            rng: Random number generator for the font size, or None for a fresh one
         """
         self.wrap_mode = wrap_mode
+        self.rng = rng if rng is not None else random.Random()
         self.padding = 5
         
         # Font setup - will be initialized on first use
@@ -30,38 +66,21 @@ class TableVisualizer:
             font_size: Font size to use, or None for random size
         """
         if font_size is None:
-            self.font_size = random.randint(12, 16)
+            self.font_size = self.rng.randint(12, 16)
         else:
             self.font_size = font_size
         
-        # Try to load the regular font
-        try:
-            self.font = ImageFont.truetype("Helvetica.ttf", self.font_size)
-        except IOError:
-            self.font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", self.font_size)
-        
-        # Try to get a bold font for headers
-        try:
-            self.header_font = ImageFont.truetype("Helvetica-Bold.ttf", self.font_size)
-        except IOError:
-            try:
-                self.header_font = ImageFont.truetype(
-                    "/System/Library/Fonts/Helvetica.ttc", self.font_size, index=1
-                )
-            except IOError:
-                # Fall back to regular font if bold isn't available
-                self.header_font = self.font
+        self.font, self.header_font = _load_fonts(self.font_size)
     
-    def _draw_dotted_line(
-        self, draw: Any, x1: int, y1: int, x2: int, y2: int, fill: Union[str, tuple]
-    ) -> None:
-        """Draw a dotted line between two points."""
+    def _dotted_line_points(
+        self, x1: int, y1: int, x2: int, y2: int
+    ) -> List[Tuple[int, int]]:
+        """Get the pixels of a dotted line: 2px dots every 10px between two points."""
         if x1 == x2:  # Vertical
-            for y in range(y1, y2, 10):
-                draw.line([(x1, y), (x1, min(y + 1, y2))], fill=fill, width=1)
+            return [(x1, y + d) for y in range(y1, y2, 10) for d in (0, 1)]
         elif y1 == y2:  # Horizontal
-            for x in range(x1, x2, 10):
-                draw.line([(x, y1), (min(x + 1, x2), y1)], fill=fill, width=1)
+            return [(x + d, y1) for x in range(x1, x2, 10) for d in (0, 1)]
+        return []
     
     def _draw_grid(
         self,
@@ -69,52 +88,44 @@ class TableVisualizer:
         dimensions: TableDimensions,
     ) -> None:
         """Draw the table grid with specified line styles, accounting for margins."""
-        margin = dimensions.margin
-        column_widths = dimensions.column_widths
-        row_heights = dimensions.row_heights
+        x_edges = dimensions.x_edges
+        y_edges = dimensions.y_edges
         hor_styles = dimensions.horizontal_styles
         ver_styles = dimensions.vertical_styles
+        left, right = x_edges[0], x_edges[-1]
+        top, bottom = y_edges[0], y_edges[-1]
         
-        # Draw vertical lines
-        x_positions = [margin + x for x in [0] + list(accumulate(column_widths))]
-        for i, x in enumerate(x_positions):
-            style = ver_styles[i]
+        # Draw vertical lines, with all dots batched into one point call
+        dots: List[Tuple[int, int]] = []
+        for x, style in zip(x_edges, ver_styles):
             if style == "solid_black":
-                draw.line(
-                    [(x, margin), (x, margin + sum(row_heights))], fill="black", width=1
-                )
+                draw.line([(x, top), (x, bottom)], fill="black", width=1)
             elif style == "dotted_black":
-                self._draw_dotted_line(
-                    draw, x, margin, x, margin + sum(row_heights), fill="black"
-                )
+                dots.extend(self._dotted_line_points(x, top, x, bottom))
             elif style == "solid_gray":
-                draw.line(
-                    [(x, margin), (x, margin + sum(row_heights))],
-                    fill=(192, 192, 192),
-                    width=1,
-                )
+                draw.line([(x, top), (x, bottom)], fill=192, width=1)
+        if dots:
+            draw.point(dots, fill="black")
         
-        # Draw horizontal lines
-        y_positions = [margin + y for y in [0] + list(accumulate(row_heights))]
-        for i, y in enumerate(y_positions):
-            style = hor_styles[i]
+        # Draw horizontal lines after the vertical ones, as they overlap
+        dots = []
+        for y, style in zip(y_edges, hor_styles):
             if style == "solid_black":
-                draw.line(
-                    [(margin, y), (margin + sum(column_widths), y)], fill="black", width=1
-                )
+                draw.line([(left, y), (right, y)], fill="black", width=1)
             elif style == "dotted_black":
-                self._draw_dotted_line(
-                    draw, margin, y, margin + sum(column_widths), y, fill="black"
-                )
+                dots.extend(self._dotted_line_points(left, y, right, y))
             elif style == "solid_gray":
-                draw.line(
-                    [(margin, y), (margin + sum(column_widths), y)],
-                    fill=(192, 192, 192),
-                    width=1,
-                )
+                draw.line([(left, y), (right, y)], fill=192, width=1)
+        if dots:
+            draw.point(dots, fill="black")
     
     def _wrap_text(
-        self, text: str, font: ImageFont.FreeTypeFont, max_width: int, wrap_mode: Optional[str] = None
+        self,
+        text: str,
+        font: ImageFont.FreeTypeFont,
+        max_width: int,
+        wrap_mode: Optional[str] = None,
+        max_lines: Optional[int] = None,
     ) -> List[str]:
         """Wrap text to fit within a maximum width.
         
@@ -123,6 +134,7 @@ class TableVisualizer:
             font: Font object for text measurement
             max_width: Maximum width in pixels for text to fit within
             wrap_mode: Text wrapping mode, or None to use instance default
+            max_lines: Stop once this many lines are wrapped, or None for no limit
             
         Returns:
             List of lines after wrapping
@@ -137,48 +149,97 @@ class TableVisualizer:
         elif wrap_mode == "word":
             # Standard word wrapping
             words = text.split()
+            if len(words) <= 1:
+                # Numbers and letter codes are one word and never wrap
+                return words
+            
             lines = []
             current_line = []
             current_width = 0.0
-            space_width = font.getlength(" ")
+            space_width = _text_length(font, " ")
             
+            # current_width counts each word plus the space that would follow it
             for word in words:
-                word_width = font.getlength(word)
+                word_width = _text_length(font, word)
                 if current_width + word_width > max_width and current_line:
                     lines.append(" ".join(current_line))
+                    if len(lines) == max_lines:
+                        return lines
                     current_line = [word]
-                    current_width = word_width
+                    current_width = word_width + space_width
                 else:
                     current_line.append(word)
-                    current_width += word_width + (space_width if current_line else 0)
+                    current_width += word_width + space_width
                     
             if current_line:
                 lines.append(" ".join(current_line))
             return lines
         
         elif wrap_mode == "char":
-            # Character-based wrapping (break words if needed)
-            lines = []
-            current_line = ""
-            current_width = 0.0
+            # Character-based wrapping (break words if needed), measuring each
+            # distinct character once and bisecting the cumulative widths
+            char_widths = {char: _text_length(font, char) for char in set(text)}
+            widths = [char_widths[char] for char in text]
+            if text and sum(widths) <= max_width:
+                # The whole text fits, as most short cells do
+                return [text]
             
-            for char in text:
-                char_width = font.getlength(char)
-                if current_width + char_width <= max_width:
-                    current_line += char
-                    current_width += char_width
-                else:
-                    if current_line:  # Only add non-empty lines
-                        lines.append(current_line)
-                    current_line = char
-                    current_width = char_width
+            offsets = list(accumulate(widths, initial=0.0))
+            lines = []
+            start = 0
             
-            if current_line:  # Add the last line if not empty
-                lines.append(current_line)
+            while start < len(text):
+                end = bisect_right(offsets, offsets[start] + max_width) - 1
+                # A character wider than max_width still gets a line of its own
+                end = max(end, start + 1)
+                lines.append(text[start:end])
+                if len(lines) == max_lines:
+                    break
+                start = end
             return lines
         
         # Default to word wrapping for any other value
-        return self._wrap_text(text, font, max_width, "word")
+        return self._wrap_text(text, font, max_width, "word", max_lines)
+    
+    def _render_cell(
+        self,
+        draw: ImageDraw.ImageDraw,
+        text: str,
+        left: int,
+        top: int,
+        cell_width: int,
+        max_lines: int,
+        font: ImageFont.FreeTypeFont,
+        line_height: int,
+        centered: bool = False,
+    ) -> None:
+        """Draw wrapped text into a cell, dropping lines that do not fit.
+        
+        Args:
+            draw: ImageDraw object to draw on
+            text: The cell text
+            left: X coordinate of the cell's left edge
+            top: Y coordinate of the cell's top edge
+            cell_width: Width of the cell in pixels
+            max_lines: Number of lines that fit in the cell's height
+            font: Font to draw the text with
+            line_height: Line height of the font in pixels
+            centered: Whether to center each line horizontally
+        """
+        if max_lines <= 0:
+            return  # Not even one line fits
+        
+        padding = self.padding
+        wrapped_text = self._wrap_text(
+            text, font, cell_width - 2 * padding, max_lines=max_lines
+        )
+        for k, line in enumerate(wrapped_text):
+            if centered:
+                x = left + (cell_width - _text_length(font, line)) // 2
+            else:
+                x = left + padding
+            y = top + padding + k * line_height
+            draw.text((x, y), line, font=font, fill="black")
     
     def render(
         self, 
@@ -206,9 +267,10 @@ class TableVisualizer:
         
         margin = dimensions.margin
         
-        # Create image with margins
+        # Create image with margins; every color used is a gray level, so an
+        # 8-bit grayscale canvas holds the same pixels as RGB at a third the size
         image = Image.new(
-            "RGB", 
+            "L", 
             (dimensions.total_width + 2 * margin, dimensions.total_height + 2 * margin), 
             "white"
         )
@@ -227,108 +289,69 @@ class TableVisualizer:
         
         column_widths = dimensions.column_widths
         row_heights = dimensions.row_heights
+        x_edges = dimensions.x_edges
+        y_edges = dimensions.y_edges
+        
+        # Bind the fonts and the cell renderer once for the loops below
+        font = self.font
+        header_font = self.header_font
+        render_cell = self._render_cell
+        
+        # Font metrics are fixed for the whole render
+        ascent, descent = font.getmetrics()
+        line_height = ascent + descent
+        ascent, descent = header_font.getmetrics()
+        header_line_height = ascent + descent
+        
+        # Lines that fit in each row depend only on its height, so count them once
+        text_heights = [height - 2 * self.padding for height in row_heights]
+        max_lines = [height // line_height for height in text_heights]
+        header_max_lines = [height // header_line_height for height in text_heights]
+        
+        # Header rows/columns shift the data cells by one
+        row_offset = 1 if has_column_headers else 0
+        col_offset = 1 if has_row_headers else 0
         
         # Draw corner header if both column and row headers exist
-        if has_column_headers and has_row_headers and corner_header is not None:
-            left = margin
-            top = margin
-            cell_width = column_widths[0]
-            cell_height = row_heights[0]
-            
-            wrapped_text = self._wrap_text(
-                corner_header, self.header_font, cell_width - 2 * self.padding
+        if has_column_headers and has_row_headers and corner_header:
+            render_cell(
+                draw, corner_header, margin, margin, column_widths[0],
+                header_max_lines[0], header_font, header_line_height, centered=True,
             )
-            ascent, descent = self.header_font.getmetrics()
-            line_height = ascent + descent
-            max_lines = (cell_height - 2 * self.padding) // line_height
-            truncated_text = wrapped_text[:max_lines]
-            
-            # Center the corner header
-            for k, line in enumerate(truncated_text):
-                line_width = self.header_font.getlength(line)
-                x = left + (cell_width - line_width) // 2
-                y = top + self.padding + k * line_height
-                draw.text((x, y), line, font=self.header_font, fill="black")
         
-        # Draw column headers
+        # Draw column headers (account for row header if present)
         if has_column_headers:
-            header_row_idx = 0
             for j, header in enumerate(column_headers):
-                if header is not None:
-                    # Calculate position (account for row header if present)
-                    col_offset = 1 if has_row_headers else 0
-                    left = margin + sum(column_widths[: j + col_offset])
-                    top = margin
-                    cell_width = column_widths[j + col_offset]
-                    cell_height = row_heights[header_row_idx]
-                    
-                    wrapped_text = self._wrap_text(
-                        header, self.header_font, cell_width - 2 * self.padding
+                if header:
+                    render_cell(
+                        draw, header, x_edges[j + col_offset], margin,
+                        column_widths[j + col_offset], header_max_lines[0],
+                        header_font, header_line_height, centered=True,
                     )
-                    ascent, descent = self.header_font.getmetrics()
-                    line_height = ascent + descent
-                    max_lines = (cell_height - 2 * self.padding) // line_height
-                    truncated_text = wrapped_text[:max_lines]
-                    
-                    # Center the header
-                    for k, line in enumerate(truncated_text):
-                        line_width = self.header_font.getlength(line)
-                        x = left + (cell_width - line_width) // 2
-                        y = top + self.padding + k * line_height
-                        draw.text((x, y), line, font=self.header_font, fill="black")
         
-        # Draw row headers
+        # Draw row headers (account for column header if present)
         if has_row_headers:
-            header_col_idx = 0
             for i, header in enumerate(row_headers):
-                if header is not None:
-                    # Calculate position (account for column header if present)
-                    row_offset = 1 if has_column_headers else 0
-                    left = margin
-                    top = margin + sum(row_heights[: i + row_offset])
-                    cell_width = column_widths[header_col_idx]
-                    cell_height = row_heights[i + row_offset]
-                    
-                    wrapped_text = self._wrap_text(
-                        header, self.header_font, cell_width - 2 * self.padding
+                if header:
+                    render_cell(
+                        draw, header, margin, y_edges[i + row_offset],
+                        column_widths[0], header_max_lines[i + row_offset],
+                        header_font, header_line_height, centered=True,
                     )
-                    ascent, descent = self.header_font.getmetrics()
-                    line_height = ascent + descent
-                    max_lines = (cell_height - 2 * self.padding) // line_height
-                    truncated_text = wrapped_text[:max_lines]
-                    
-                    # Center the header
-                    for k, line in enumerate(truncated_text):
-                        line_width = self.header_font.getlength(line)
-                        x = left + (cell_width - line_width) // 2
-                        y = top + self.padding + k * line_height
-                        draw.text((x, y), line, font=self.header_font, fill="black")
         
-        # Draw data cells
-        for i in range(len(data)):
-            for j in range(len(data[i])):
-                cell_value = data[i][j]
-                if cell_value is not None:
-                    # Calculate position (account for headers)
-                    row_offset = 1 if has_column_headers else 0
-                    col_offset = 1 if has_row_headers else 0
-                    left = margin + sum(column_widths[: j + col_offset])
-                    top = margin + sum(row_heights[: i + row_offset])
-                    cell_width = column_widths[j + col_offset]
-                    cell_height = row_heights[i + row_offset]
-                    
-                    wrapped_text = self._wrap_text(
-                        cell_value, self.font, cell_width - 2 * self.padding
-                    )
-                    ascent, descent = self.font.getmetrics()
-                    line_height = ascent + descent
-                    max_lines = (cell_height - 2 * self.padding) // line_height
-                    truncated_text = wrapped_text[:max_lines]
-                    
-                    # Regular cell text alignment (left-aligned)
-                    for k, line in enumerate(truncated_text):
-                        x = left + self.padding
-                        y = top + self.padding + k * line_height
-                        draw.text((x, y), line, font=self.font, fill="black")
+        # Draw data cells (left-aligned), visiting only the filled ones; empty
+        # strings draw nothing, so they are skipped like None
+        filled_cells = [
+            (i, j, cell_value)
+            for i, row in enumerate(data)
+            for j, cell_value in enumerate(row)
+            if cell_value
+        ]
+        for i, j, cell_value in filled_cells:
+            render_cell(
+                draw, cell_value, x_edges[j + col_offset],
+                y_edges[i + row_offset], column_widths[j + col_offset],
+                max_lines[i + row_offset], font, line_height,
+            )
         
         return image
\ No newline at end of file
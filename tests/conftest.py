@@ -1,13 +1,17 @@
 """Test configuration for table_maker."""
 
+import os
 import tempfile
 from pathlib import Path
 
 import pytest
 
+# Write test output to RAM-backed tmpfs where the platform provides one
+TEMP_ROOT = "/dev/shm" if os.access("/dev/shm", os.W_OK) else None
+
 
 @pytest.fixture
 def temp_output_dir():
     """Provide a temporary directory for output files."""
-    with tempfile.TemporaryDirectory() as temp_dir:
+    with tempfile.TemporaryDirectory(dir=TEMP_ROOT) as temp_dir:
         yield Path(temp_dir)
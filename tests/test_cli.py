@@ -47,6 +47,8 @@ def test_parse_args():
     assert not args.allow_empty_columns
     assert args.large_number_probability == 0.05
     assert args.headers == "none"
+    assert args.png_compress_level == 1
+    assert args.pretty_json is False
 
 
 def test_main_function(temp_output_dir):
@@ -1,8 +1,13 @@
 import json
-from PIL import Image
+import os
+import struct
+from pathlib import Path
+from typing import Any, Dict, Set
 
+import pytest
 
 from table_maker import (
+    encode_table,
     generate_table,
     generate_tables,
     generate_table_dimensions,
@@ -11,6 +16,14 @@ from table_maker import (
     RandomDataGenerator,
     TableVisualizer,
 )
+from table_maker import maker
+from table_maker.visualizer import _load_fonts
+
+
+def list_names(directory: Path) -> Set[str]:
+    """List a directory's entry names with one scandir instead of a stat per file."""
+    with os.scandir(directory) as entries:
+        return {entry.name for entry in entries}
 
 
 def test_generate_table_dimensions():
@@ -181,22 +194,24 @@ def test_generate_table(temp_output_dir):
         output_filename="test_table",
         is_normal=True,  # Use normal table for deterministic test
         margin=10,
+        png_compress_level=0,  # Compression is irrelevant to these checks
     )
 
     # Check that the files were created
     assert image_path.exists()
     assert json_path.exists()
 
-    # Check that image file is a valid PNG
-    with Image.open(image_path) as img:
-        assert img.format == "PNG"
-        # Image should have some reasonable dimensions
-        assert img.width > 100
-        assert img.height > 100
+    # Check that image file is a valid PNG from its signature and IHDR chunk
+    header = image_path.read_bytes()[:24]
+    assert header[:8] == b"\x89PNG\r\n\x1a\n"
+    assert header[12:16] == b"IHDR"
+    width, height = struct.unpack(">II", header[16:24])
+    # Image should have some reasonable dimensions
+    assert width > 100
+    assert height > 100
 
     # Check that JSON file contains expected structure
-    with open(json_path) as f:
-        data = json.load(f)
+    data = json.loads(json_path.read_text())
 
     # Verify JSON structure
     assert "data" in data
@@ -205,6 +220,56 @@ def test_generate_table(temp_output_dir):
     assert "has_row_headers" in data
 
 
+def test_encode_table():
+    """Test that encode_table returns encoded output without writing files."""
+    png, js = encode_table(
+        min_rows=2,
+        min_columns=3,
+        max_rows=5,
+        max_columns=6,
+        is_normal=True,
+        seed=3,
+    )
+
+    assert png[:8] == b"\x89PNG\r\n\x1a\n"
+    data = json.loads(js)
+    assert isinstance(data["data"], list)
+    assert "has_column_headers" in data
+
+
+def test_encode_table_pretty_json():
+    """Test that pretty_json indents the JSON without changing its content."""
+    params: Dict[str, Any] = dict(
+        min_rows=2, min_columns=3, max_rows=5, max_columns=6, seed=3
+    )
+    _, compact = encode_table(pretty_json=False, **params)
+    _, pretty = encode_table(pretty_json=True, **params)
+
+    assert b"\n" not in compact
+    assert b'": ' not in compact
+    assert b'\n  "' in pretty
+    assert json.loads(compact) == json.loads(pretty)
+
+
+def test_encode_table_without_orjson(monkeypatch):
+    """Test that the standard json fallback encodes the same data as orjson."""
+    pytest.importorskip("orjson")
+    params: Dict[str, Any] = dict(
+        min_rows=2, min_columns=3, max_rows=5, max_columns=6, seed=3
+    )
+    _, default = encode_table(**params)
+
+    monkeypatch.setattr(maker, "orjson", None)
+    _, fallback = encode_table(**params)
+    _, pretty = encode_table(pretty_json=True, **params)
+
+    # The encoders escape non-ASCII text differently, so compare decoded data
+    assert json.loads(fallback) == json.loads(default)
+    assert json.loads(pretty) == json.loads(default)
+    sample = {"currency": "Costa Rican colón"}
+    assert json.loads(maker._dump_json(sample)) == sample
+
+
 def test_table_visualizer():
     """Test the TableVisualizer class."""
     # Create test data
@@ -245,6 +310,45 @@ def test_table_visualizer():
     assert image.height == 300 + 2 * 10  # total_height + 2*margin
 
 
+def test_wrap_text_word_fits_width():
+    """Test that word-wrapped lines never overflow the cell width."""
+    font, _ = _load_fonts(12)
+    visualizer = TableVisualizer()
+    text = "alpha beta gamma delta epsilon zeta eta theta iota kappa lambda"
+
+    for max_width in range(60, 160, 5):
+        lines = visualizer._wrap_text(text, font, max_width, "word")
+        assert len(lines) >= 3
+        for line in lines:
+            if " " in line:
+                assert font.getlength(line) <= max_width
+
+
+def test_wrap_text_char():
+    """Test character wrapping of long tokens, wide glyphs and line limits."""
+    font, _ = _load_fonts(12)
+    visualizer = TableVisualizer()
+
+    # Text that fits comes back whole as a single line
+    assert visualizer._wrap_text("short", font, 200, "char") == ["short"]
+
+    # A long token breaks across lines that each fit the width
+    token = "abcdefghijklmnopqrstuvwxyz0123456789"
+    lines = visualizer._wrap_text(token, font, 40, "char")
+    assert len(lines) > 1
+    assert "".join(lines) == token
+    for line in lines:
+        assert sum(font.getlength(char) for char in line) <= 40
+
+    # A glyph wider than max_width still gets a line of its own
+    narrow = int(font.getlength("W")) - 1
+    assert visualizer._wrap_text("WiW", font, narrow, "char") == ["W", "i", "W"]
+
+    # max_lines stops wrapping once the limit is reached
+    truncated = visualizer._wrap_text(token, font, 40, "char", max_lines=2)
+    assert truncated == lines[:2]
+
+
 def test_generate_tables(temp_output_dir):
     """Test that generate_tables produces the expected number of files."""
     # Generate multiple tables
@@ -257,6 +361,7 @@ def test_generate_tables(temp_output_dir):
         max_rows=4,
         max_columns=4,
         is_normal=True,  # Use normal table for deterministic test
+        png_compress_level=0,  # Compression is irrelevant to these checks
     )
 
     # Check that we got the expected number of results
@@ -268,11 +373,33 @@ def test_generate_tables(temp_output_dir):
     assert images_dir.exists()
     assert json_dir.exists()
 
-    # Check that all files exist
+    # Check that all files exist, listing each directory once
+    image_names = list_names(images_dir)
+    json_names = list_names(json_dir)
     for image_path, json_path in results:
-        assert image_path.exists()
-        assert json_path.exists()
+        assert image_path.name in image_names
+        assert json_path.name in json_names
 
     # Check that the number of files in each directory matches count
-    assert len(list(images_dir.glob("*.png"))) == count
-    assert len(list(json_dir.glob("*.json"))) == count
+    assert sum(name.endswith(".png") for name in image_names) == count
+    assert sum(name.endswith(".json") for name in json_names) == count
+
+
+def test_generate_tables_parallel(temp_output_dir):
+    """Test that parallel generation matches serial output for the same seed."""
+    serial_dir = temp_output_dir / "serial"
+    parallel_dir = temp_output_dir / "parallel"
+    params: Dict[str, Any] = dict(
+        count=4, min_rows=2, min_columns=2, max_rows=4, max_columns=4, seed=7
+    )
+
+    serial = generate_tables(output_dir=serial_dir, workers=1, **params)
+    parallel = generate_tables(output_dir=parallel_dir, workers=2, **params)
+
+    assert [p.name for p, _ in serial] == [p.name for p, _ in parallel]
+    for (_, serial_json), (_, parallel_json) in zip(serial, parallel):
+        assert serial_json.read_text() == parallel_json.read_text()
+
+    # No tables means no pool, whatever the worker count
+    empty_dir = temp_output_dir / "empty"
+    assert generate_tables(count=0, output_dir=empty_dir, workers=2) == []